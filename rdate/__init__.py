@@ -3,12 +3,113 @@
 # License: MIT, see LICENSE for details.
 
 import calendar as _calendar
+import collections.abc as _abc
 import datetime as _datetime
 import enum as _enum
+import functools as _functools
+import math as _math
 import re as _re
+import time as _time
 
 
-__all__ = ['Period', 'Weekday', 'set_first_day_of_week', 'Time', 'Date', 'DateTime', 'timestamp']
+__all__ = ['Period', 'Weekday', 'set_first_day_of_week', 'Time', 'Date', 'DateRange', 'DateTime', 'timestamp']
+
+
+def _compile_parser(name, fields, *shapes):
+    """Return a function *name* that parses strings of fixed *shapes* into a tuple of int *fields*.
+    Shapes are tried in order. A run of a field letter is a run of ASCII digits, '[...]' matches any one of
+    the enclosed characters, any other character must match literally, and a trailing '$' requires the
+    string to end there (otherwise trailing text is ignored.) Fields missing from a shape are 0.
+    The function returns None if no shape matches."""
+    lines = [f'def {name}(s):']
+    for shape in shapes:
+        exact = shape.endswith('$')
+        shape = _re.findall(r'\[[^]]*\]|[^$]', shape)
+        digits = [i for i, c in enumerate(shape) if c in fields]
+        checks = [f'len(s) {"==" if exact else ">="} {len(shape)}']
+        for i, c in enumerate(shape):
+            if c.startswith('['):
+                checks.append(f's[{i}] in {c[1:-1]!r}')
+            elif c not in fields:
+                checks.append(f's[{i}] == {c!r}')
+        values = []
+        for field in fields:
+            positions = [i for i, c in enumerate(shape) if c == field]
+            scales = [10 ** (len(positions)-k-1) for k in range(len(positions))]
+            terms = [f'c{p}*{scale}' if scale > 1 else f'c{p}' for p, scale in zip(positions, scales)]
+            values.append(' + '.join(terms) or '0')
+        lines.append(f'    if {" and ".join(checks)}:')
+        lines += [f'        c{i} = ord(s[{i}]) - 48' for i in digits]
+        lines.append(f'        if {" and ".join(f"0 <= c{i} <= 9" for i in digits)}:')
+        lines.append(f'            return {", ".join(values)}')
+    lines.append('    return None')
+    namespace = {}
+    exec(compile('\n'.join(lines), f'<{name}>', 'exec'), namespace)
+    return namespace[name]
+
+
+_parse_date = _compile_parser('_parse_date', 'YMD', 'YYYY-MM-DD')
+_parse_time = _compile_parser('_parse_time', 'hms', 'hh:mm:ss', 'hh:mm$')
+_parse_datetime = _compile_parser('_parse_datetime', 'YMDhms', 'YYYY-MM-DD[ .,@:T]hh:mm:ss', 'YYYY-MM-DD[ .,@:T]hh:mm$')
+
+
+_TIME_RE = _re.compile(r'^(\d{1,2}):(\d{1,2}):(\d{1,2})')
+_DATE_RE = _re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})')
+
+
+def _split_datetime(s):
+    """Return (date, time) strings of *s*: the leading run of digits and '-', and after one of ' .,@:T'
+    the following run of digits and ':'. Return None if the separator is missing."""
+    date = s[:len(s) - len(s.lstrip('0123456789-'))]
+    if len(date) == len(s) or s[len(date)] not in ' .,@:T':
+        return None
+    rest = s[len(date)+1:]
+    return date, rest[:len(rest) - len(rest.lstrip('0123456789:'))]
+
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _isleap(year):
+    """Return True if *year* is a leap year."""
+    return ((year & 3) == 0) & ((year % 25 != 0) | ((year & 15) == 0))
+
+
+def _days_in_month(year, month):
+    """Return number of days in *month* of *year*."""
+    return _DAYS_IN_MONTH[month] + ((month == 2) & _isleap(year))
+
+
+def _add_months(year, month, day, n):
+    """Return (year, month, day) *n* months after the given date, clamping the day to the length of the month."""
+    year, month = divmod(year*12 + month - 1 + n, 12)
+    month += 1
+    return year, month, min(day, _days_in_month(year, month))
+
+
+def _ymd_to_rd(year, month, day):
+    """Return proleptic Gregorian ordinal (rata die, 0001-01-01 is day 1) of *year*, *month*, and *day*.
+    Computed on the computational calendar where the year starts in March, so February comes last."""
+    j = month < 3
+    year -= j
+    month += 12 * j
+    return 365*year + year//4 - year//100 + year//400 + (153*(month-3) + 2)//5 + day - 306
+
+
+def _rd_to_ymd(rd):
+    """Return (year, month, day) of proleptic Gregorian ordinal *rd* (inverse of _ymd_to_rd.)
+    Uses the Neri-Schneider Euclidean affine functions on the computational calendar."""
+    n = 4 * (rd + 305) + 3
+    century = n // 146097
+    n = 4 * (n % 146097 // 4) + 3
+    p = 2939745 * n
+    day_of_year = (p & 0xFFFFFFFF) // 2939745 // 4
+    n = 2141 * day_of_year + 197913
+    j = day_of_year >= 306
+    return 100*century + (p >> 32) + j, (n >> 16) - 12*j, (n & 0xFFFF) // 2141 + 1
+
+
+_PERIOD_ORDER = {'d': 0, 'w': 1, 'm': 2, 'y': 3}
 
 
 class Period(_enum.Enum):
@@ -21,8 +122,7 @@ class Period(_enum.Enum):
 
     def __lt__(self, other):
         """Return True if *other* is shorter than self."""
-        order = {'d': 0, 'w': 1, 'm': 2, 'y': 3}
-        return isinstance(other, Period) and order[self.value] < order[other.value]
+        return isinstance(other, Period) and _PERIOD_ORDER[self.value] < _PERIOD_ORDER[other.value]
 
 
 class Weekday(_enum.Enum):
@@ -38,7 +138,7 @@ class Weekday(_enum.Enum):
 
     def __add__(self, n):
         """Return Weekday *n* days after self."""
-        return Weekday(self.value+(n % 7))
+        return _WEEKDAYS[(self.value + n) % 7]
 
     def __sub__(self, n):
         """Return Weekday *n* days before self.
@@ -47,7 +147,7 @@ class Weekday(_enum.Enum):
         if isinstance(n, Weekday):
             return self.value - n.value
         else:
-            return Weekday(self.value+((7-n) % 7))
+            return _WEEKDAYS[(self.value - n) % 7]
 
     def __lt__(self, other):
         """Return True if *other* is before self."""
@@ -69,6 +169,9 @@ class Weekday(_enum.Enum):
         return list(cls._order.keys())
 
 
+_WEEKDAYS = tuple(Weekday(n) for n in range(7))
+
+
 def set_first_day_of_week(weekday):
     """Set the Weekday wich which the week begins (defaults to Monday.)"""
     Weekday._order = {Weekday(n % 7): p for p, n in enumerate(range(weekday.value, weekday.value+7))}
@@ -76,9 +179,18 @@ def set_first_day_of_week(weekday):
 set_first_day_of_week(Weekday.Monday)
 
 
+@_functools.lru_cache(maxsize=4096)
+def _fmt_time(hour, minute, second):
+    """Return 'hh:mm:ss' string of *hour*, *minute*, and *second* (cached.)"""
+    return f'{hour:02}:{minute:02}:{second:02}'
+
+
+@_functools.total_ordering
 class Time:
     """Time representation with second precision."""
 
+    __slots__ = ('_hour', '_minute', '_second')
+
     @classmethod
     def now(cls):
         """Return Time object that represents 'now'."""
@@ -88,12 +200,12 @@ class Time:
     @classmethod
     def start_of_day(cls):
         """Return Time object that represents the start of the day (mid-night.)"""
-        return cls(0)
+        return _TIME_START
 
     @classmethod
     def end_of_day(cls):
         """Return Time object that represents the end of the day (one second to mid-night.)"""
-        return cls(23, 59, 59)
+        return _TIME_END
 
     def _init(self, hour, minute, second):
         """Set and verify valid time.
@@ -108,18 +220,30 @@ class Time:
         if self.second < 0 or self.second > 59:
             raise ValueError(f'Invalid second: {self.second}')
 
+    @classmethod
+    def _unchecked(cls, hour, minute, second):
+        """Return new Time object from int *hour*, *minute*, and *second* that are known to be valid."""
+        time = cls.__new__(cls)
+        time._hour = hour
+        time._minute = minute
+        time._second = second
+        return time
+
     def __init__(self, value, minute=0, second=0):
         """Create new Time object from integer arguments or a string of format 'hh:mm[:ss]'.
         Raise ValueError if arguments are invalid or string cannot be parsed."""
         if isinstance(value, int):
             self._init(value, minute, second)
         elif isinstance(value, str):
-            found = _re.match('^(\d{1,2}):(\d{1,2}):(\d{1,2})', value + ':00')
-            if not found:
-                raise ValueError(f'Invalid time: {value}')
-            self._init(found.group(1), found.group(2), found.group(3))
+            parsed = _parse_time(value)
+            if parsed is None:
+                found = _TIME_RE.match(value + ':00')
+                if not found:
+                    raise ValueError(f'Invalid time: {value}')
+                parsed = found.groups()
+            self._init(*parsed)
         elif isinstance(value, Time):
-            self._init(value.hour, value.minute, value.second)
+            self._hour, self._minute, self._second = value._hour, value._minute, value._second
         else:
             raise ValueError(f'Invalid time: {value}')
 
@@ -140,49 +264,54 @@ class Time:
         return (other.hour - self.hour) * 3600 + (other.minute - self.minute) * 60 + (other.second - self.second)
 
     def __eq__(self, other):
-        return isinstance(other, Time) and self.hour == other.hour and self.minute == other.minute and self.second == other.second
+        return isinstance(other, Time) and (self._hour, self._minute, self._second) == (other._hour, other._minute, other._second)
 
     def __lt__(self, other):
-        return self.diff(other) > 0
-
-    def __le__(self, other):
-        return self == other or self < other
+        return (self._hour, self._minute, self._second) < (other._hour, other._minute, other._second)
 
     def __str__(self):
-        return f'{self.hour:02}:{self.minute:02}:{self.second:02}'
+        return _fmt_time(self._hour, self._minute, self._second)
 
     def __repr__(self):
         return self.__str__()
 
     def __hash__(self):
-        return hash(self.__repr__())
+        return hash((self._hour, self._minute, self._second))
+
+
+_TIME_START = Time(0)
+_TIME_END = Time(23, 59, 59)
 
 
+@_functools.total_ordering
 class Date:
     """Date representation with utility methods."""
 
+    __slots__ = ('_year', '_month', '_day')
+
+    _today = None
+    _today_ordinal = -1
+
     @classmethod
     def today(cls):
-        """Return Date object that represents 'today'."""
+        """Return Date object that represents 'today' (cached until the day changes.)"""
         today = _datetime.date.today()
-        return cls(today.year, today.month, today.day)
+        ordinal = today.toordinal()
+        if ordinal != cls.__dict__.get('_today_ordinal'):
+            cls._today = cls(today.year, today.month, today.day)
+            cls._today_ordinal = ordinal
+        return cls._today
 
     @classmethod
     def find_day(cls, year, month, weekday, n=1):
         """Return Date object which represents the *n*th *weekday* within a *month*, e.g. 3rd Monday.
         Raise ValueError if *n* is not realistic e.g. 5th Monday."""
-        if n > 5:
+        if n < 1 or n > 5:
             raise ValueError('Cannot find day')
-        d = cls(year, month, 1)
-        while n > 0:
-            while d.weekday != weekday:
-                d = d.next()
-            n -= 1
-            if n > 0:
-                d = d.next()
-        if d.month != month:
+        day = 1 + (weekday.value - _calendar.weekday(year, month, 1)) % 7 + (n-1) * 7
+        if day > _days_in_month(year, month):
             raise ValueError('Cannot find day')
-        return d
+        return cls(year, month, day)
 
     _min_year = 1500
     _max_year = 2500
@@ -197,22 +326,47 @@ class Date:
         if self.month < 1 or self.month > 12:
             raise ValueError(f'Invalid month: {self.month}')
         self._day = int(day)
-        _, last_day_of_month = _calendar.monthrange(self.year, self.month)
+        last_day_of_month = _days_in_month(self.year, self.month)
         if self.day < 1 or self.day > last_day_of_month:
             raise ValueError(f'Invalid day (1-{last_day_of_month}): {self.day}')
 
+    @classmethod
+    def _unchecked(cls, year, month, day):
+        """Return new Date object from int *year*, *month*, and *day* that are known to be valid."""
+        date = cls.__new__(cls)
+        date._year = year
+        date._month = month
+        date._day = day
+        return date
+
+    @classmethod
+    def from_ordinal(cls, ordinal):
+        """Return new Date object from a proleptic Gregorian *ordinal* (as datetime.date.toordinal, 0001-01-01 is 1.)
+        Raise ValueError if the year is out of the valid range."""
+        year, month, day = _rd_to_ymd(ordinal)
+        if year < Date._min_year or year > Date._max_year:
+            raise ValueError(f'Invalid year ({Date._min_year}-{Date._max_year}): {year}')
+        return cls._unchecked(year, month, day)
+
+    def _ordinal(self):
+        """Return proleptic Gregorian ordinal of self (see _ymd_to_rd.)"""
+        return _ymd_to_rd(self._year, self._month, self._day)
+
     def __init__(self, value, month=1, day=1):
         """Create new Date object from integer arguments or a string of format 'YYYY-MM-DD'.
         Raise ValueError if arguments are invalid or string cannot be parsed."""
         if isinstance(value, int):
             self._init(value, month, day)
         elif isinstance(value, str):
-            found = _re.match('^(\d{4})-(\d{1,2})-(\d{1,2})', value)
-            if not found:
-                raise ValueError(f'Invalid date: {value}')
-            self._init(found.group(1), found.group(2), found.group(3))
+            parsed = _parse_date(value)
+            if parsed is None:
+                found = _DATE_RE.match(value)
+                if not found:
+                    raise ValueError(f'Invalid date: {value}')
+                parsed = found.groups()
+            self._init(*parsed)
         elif isinstance(value, Date):
-            self._init(value.year, value.month, value.day)
+            self._year, self._month, self._day = value._year, value._month, value._day
         else:
             raise ValueError(f'Invalid date: {value}')
 
@@ -230,7 +384,7 @@ class Date:
 
     @property
     def weekday(self):
-        return Weekday(_calendar.weekday(self.year, self.month, self.day))
+        return _WEEKDAYS[(_ymd_to_rd(self._year, self._month, self._day) - 1) % 7]
 
     @property
     def istoday(self):
@@ -247,25 +401,16 @@ class Date:
     @property
     def isleap(self):
         """True if self is a Date within a leap year"""
-        return self.length(period=Period.Year) == 366
+        return _isleap(self._year)
 
     def move(self, n=0, period=Period.Day):
         """Return new Date *n* periods away from self. *n* can be negative or positive."""
         if period is Period.Day:
-            moved_date = _datetime.date(self.year, self.month, self.day) + _datetime.timedelta(days=n)
-            return Date(moved_date.year, moved_date.month, moved_date.day)
+            return Date.from_ordinal(self._ordinal() + _math.floor(n))
         if period is Period.Week:
             return self.move(n*7, Period.Day)
         if period is Period.Month:
-            if (self.month + n) < 1:
-                year = self.year + int((self.month + n - 12) / 12)
-            else:
-                year = self.year + int((self.month + n - 1) / 12)
-            month = (self.month + n) % 12
-            if month < 1:
-                month += 12
-            _, last_day_of_month = _calendar.monthrange(year, month)
-            return Date(year, month, min(self.day, last_day_of_month))
+            return Date(*_add_months(self._year, self._month, self._day, n))
         if period is Period.Year:
             return Date(self.year + n, self.month, self.day)
 
@@ -288,15 +433,14 @@ class Date:
         if period is Period.Week:
             return self.move(-self.weekday.value), to_date.move(6-to_date.weekday.value)
         if period is Period.Month:
-            _, last_day_of_month = _calendar.monthrange(to_date.year, to_date.month)
-            return Date(self.year, self.month, 1), Date(to_date.year, to_date.month, last_day_of_month)
+            return Date(self.year, self.month, 1), Date(to_date.year, to_date.month, _days_in_month(to_date.year, to_date.month))
         if period is Period.Year:
             return Date(self.year, 1, 1), Date(to_date.year, 12, 31)
 
     def diff(self, other, period=Period.Day):
         """Return difference to *other* date in *period* (positive if other is later.)"""
         if period is Period.Day:
-            return _datetime.date(other.year, other.month, other.day).toordinal() - _datetime.date(self.year, self.month, self.day).toordinal()
+            return other._ordinal() - self._ordinal()
         if period is Period.Week:
             if self <= other:
                 first, last = self.envelope(period, other)
@@ -310,36 +454,93 @@ class Date:
 
     def length(self, period=Period.Month):
         """Return length in days of *period* that contains self (e.g. length of month or year.)"""
-        first, last = self.envelope(period)
-        return first.diff(last) + 1
+        if period is Period.Day:
+            return 1
+        if period is Period.Week:
+            return 7
+        if period is Period.Month:
+            return _days_in_month(self._year, self._month)
+        if period is Period.Year:
+            return 365 + _isleap(self._year)
 
     def range(self, to_date=None, n=None):
-        """Return list of dates between self and *to_date* or for *n* days starting with
+        """Return DateRange of dates between self and *to_date* or for *n* days starting with
         self (backwards if *n* is negative or *to_date* is before self.)"""
-        if to_date is not None:
-            n = self.diff(to_date)
-        n = n + 1 if n >= 0 else n - 1
-        return [self.move(n=_) for _ in range(0, n, 1 if n >= 1 else -1)]
+        if to_date is None:
+            to_date = Date.from_ordinal(self._ordinal() + n)
+        return DateRange(self, to_date)
+
+    @classmethod
+    def range_ordinals(cls, start, end):
+        """Return range of proleptic Gregorian ordinals from *start* to *end* date inclusive (backwards if *end*
+        is before *start*.) Suitable for vectorized math e.g. with numpy; see from_ordinal to get a Date back."""
+        first, last = start._ordinal(), end._ordinal()
+        step = 1 if last >= first else -1
+        return range(first, last + step, step)
 
     def __eq__(self, other):
-        return isinstance(other, Date) and self.year == other.year and self.month == other.month and self.day == other.day
+        return isinstance(other, Date) and (self._year, self._month, self._day) == (other._year, other._month, other._day)
 
     def __lt__(self, other):
-        return self.year < other.year or \
-               (self.year == other.year and self.month < other.month) or \
-               (self.year == other.year and self.month == other.month and self.day < other.day)
+        return (self._year, self._month, self._day) < (other._year, other._month, other._day)
+
+    def __str__(self):
+        return f'{self.year:04}-{self.month:02}-{self.day:02}'
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __hash__(self):
+        return hash((self._year, self._month, self._day))
+
+
+@_functools.lru_cache(maxsize=4096)
+def _make_date(ordinal):
+    """Return shared Date object for a valid proleptic Gregorian *ordinal* (see _ymd_to_rd.)"""
+    return Date._unchecked(*_rd_to_ymd(ordinal))
 
-    def __le__(self, other):
-        return self == other or self < other
+
+class DateRange(_abc.Sequence):
+    """Lazy sequence of consecutive dates; Date objects are only created when accessed."""
+
+    __slots__ = ('_ordinals',)
+
+    def __init__(self, start, end):
+        """Create new DateRange from *start* to *end* date inclusive (backwards if *end* is before *start*.)"""
+        self._ordinals = Date.range_ordinals(start, end)
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            sliced = DateRange.__new__(DateRange)
+            sliced._ordinals = self._ordinals[index]
+            return sliced
+        return _make_date(self._ordinals[index])
+
+    def __iter__(self):
+        return map(_make_date, self._ordinals)
+
+    def __reversed__(self):
+        return map(_make_date, reversed(self._ordinals))
+
+    def __contains__(self, date):
+        return isinstance(date, Date) and date._ordinal() in self._ordinals
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == other
+        return isinstance(other, DateRange) and self._ordinals == other._ordinals
 
     def __str__(self):
-        return 'f{self.year:04}-{self.month:02}-{self.day:02}'
+        return str(list(self))
 
     def __repr__(self):
         return self.__str__()
 
     def __hash__(self):
-        return hash(self.__repr__())
+        return hash(self._ordinals)
 
 
 # TODO Support other timezones.
@@ -358,14 +559,27 @@ class Timezone(_enum.Enum):
     def offset(cls, dt):
         """Return time offset for the date/time based on timezone and DST rules."""
         assert dt.timezone == Timezone.EST5EDT
-        dst_start = Date.find_day(dt.date.year, 3, Weekday.Sunday, 2)
-        dst_end = Date.find_day(dt.date.year, 11, Weekday.Sunday, 1)
-        return 4 if dst_start <= dt.date <= dst_end else 5
+        dst_start, dst_end = _dst_bounds(dt.date.year)
+        return 4 if dst_start <= dt.date._ordinal() <= dst_end else 5
+
+
+_dst_cache = {}
 
+def _dst_bounds(year):
+    """Return ordinals of the first and last day of DST in *year* (cached per year.)"""
+    bounds = _dst_cache.get(year)
+    if bounds is None:
+        bounds = (Date.find_day(year, 3, Weekday.Sunday, 2)._ordinal(), Date.find_day(year, 11, Weekday.Sunday, 1)._ordinal())
+        _dst_cache[year] = bounds
+    return bounds
 
+
+@_functools.total_ordering
 class DateTime:
     """DateTime representation based on a tuple of Date and Time."""
 
+    __slots__ = ('_date', '_time', '_timezone', '_isostr')
+
     @classmethod
     def now(cls):
         """Return DateTime that represents 'now'."""
@@ -375,28 +589,50 @@ class DateTime:
         """Create new DateTime from a Date, a Date and Time tuple, an integer timestamp, or a string of format 'YYYY-MM-DD hh:mm[:ss]'.
         Raise ValueError if arguments are invalid or string cannot be parsed."""
         self._timezone = Timezone.default()
+        self._isostr = None
         if isinstance(value, Date):
             self._date = value
             self._time = Time.start_of_day()
         elif isinstance(value, tuple):
             self._date, self._time = value
         elif isinstance(value, str):
+            parsed = _parse_datetime(value)
+            if parsed is not None:
+                date_args, time_args = parsed[:3], parsed[3:]
+            else:
+                parts = _split_datetime(value)
+                if parts is None:
+                    raise ValueError(f'Invalid date/time: {value}')
+                date_args, time_args = parts[:1], parts[1:]
             try:
-                found = _re.match('^([\d-]*)[ .,@:T]([\d:]*)', value)
-                self._date = Date(found.group(1))
-                self._time = Time(found.group(2))
-            except:
-                raise ValueError(f'Invalid date/time: {value}')
+                self._date = Date(*date_args)
+                self._time = Time(*time_args)
+            except ValueError:
+                raise ValueError(f'Invalid date/time: {value}') from None
         elif isinstance(value, int):
             dt = _datetime.datetime.fromtimestamp(value)
             self._date = Date(dt.year, dt.month, dt.day)
             self._time = Time(dt.hour, dt.minute, dt.second)
         elif isinstance(value, DateTime):
-            self._date = Date(value.date)
-            self._time = Time(value.time)
+            self._date = value._date
+            self._time = value._time
         else:
             raise ValueError(f'Invalid date/time: {value}')
 
+    @classmethod
+    def _unchecked(cls, date, time):
+        """Return new DateTime object in the default timezone from a *date* and a *time* object."""
+        dt = cls.__new__(cls)
+        dt._timezone = Timezone.default()
+        dt._date = date
+        dt._time = time
+        dt._isostr = None
+        return dt
+
+    def _ordsec(self):
+        """Return self as seconds counted from the start of ordinal day 0 (see Date._ordinal.)"""
+        return self._date._ordinal() * 86400 + self._time._hour * 3600 + self._time._minute * 60 + self._time._second
+
     @property
     def date(self):
         return self._date
@@ -417,9 +653,7 @@ class DateTime:
     def diff(self, other):
         """Return difference to *other* in seconds (positive if other is later.)"""
         assert other is None or self.timezone == other.timezone
-        delta = _datetime.datetime(other.date.year, other.date.month, other.date.day, other.time.hour, other.time.minute, other.time.second) - \
-                _datetime.datetime(self.date.year, self.date.month, self.date.day, self.time.hour, self.time.minute, self.time.second)
-        return int(delta.total_seconds())
+        return other._ordsec() - self._ordsec()
 
     def since(self):
         """Return seconds passed from self to now."""
@@ -427,40 +661,45 @@ class DateTime:
 
     def to(self, seconds):
         """Return new DateTime after *seconds* from self."""
-        dt = _datetime.datetime(self.date.year, self.date.month, self.date.day, self.time.hour, self.time.minute, self.time.second)
-        dt += _datetime.timedelta(seconds=seconds)
-        return DateTime((Date(dt.year, dt.month, dt.day), Time(dt.hour, dt.minute, dt.second)))
+        ordinal, second = divmod(self._ordsec() + _math.floor(seconds), 86400)
+        hour, second = divmod(second, 3600)
+        minute, second = divmod(second, 60)
+        return DateTime._unchecked(Date.from_ordinal(ordinal), Time._unchecked(hour, minute, second))
 
     def __eq__(self, other):
         assert other is None or self.timezone == other.timezone
-        return isinstance(other, DateTime) and self.date == other.date and self.time == other.time
+        return isinstance(other, DateTime) and (self._date, self._time) == (other._date, other._time)
 
     def __lt__(self, other):
         assert other is None or self.timezone == other.timezone
-        return self.date < other.date or (self.date == other.date and self.time < other.time)
-
-    def __le__(self, other):
-        return self == other or self < other
+        d, t, od, ot = self._date, self._time, other._date, other._time
+        return ((d._year, d._month, d._day, t._hour, t._minute, t._second) <
+                (od._year, od._month, od._day, ot._hour, ot._minute, ot._second))
 
     def isostr(self):
         """Return an ISO formatted string."""
-        return f'{self.date.year:04}-{self.date.month:02}-{self.date.day:02}T{self.time.hour:02}:{self.time.minute:02}:{self.time.second:02}.000000-{self.offset:02}:00'
+        if self._isostr is None:
+            self._isostr = f'{self.date}T{self.time}.000000-{self.offset:02}:00'
+        return self._isostr
 
     def __str__(self):
-        return f'{self.date.year:04}-{self.date.month:02}-{self.date.day:02} {self.time.hour:02}:{self.time.minute:02}:{self.time.second:02} {self.timezone.value}'
+        return f'{self.date} {self.time} {self.timezone.value}'
 
     def __repr__(self):
         return self.__str__()
 
     def __hash__(self):
-        return hash(self.__repr__())
+        return hash((self._date, self._time))
 
 
 def timestamp(value=None, prec=0.001):
     """Return POSIX timestamp as int for DateTime, Date, or Date and Time tuple in seconds.
     Return current POSIX timestamp as int if value is None with given precision (defaults to 0.001 for milliseconds.)"""
     if value is None:
-        return int(_datetime.datetime.now().timestamp()/prec)
+        ns = _time.time_ns()
+        scale = prec * 1_000_000_000
+        unit = int(scale)
+        return ns // unit if unit >= 1 and unit == scale else int(ns / scale)
     if isinstance(value, DateTime):
         date = value.date
         time = value.time
@@ -2,11 +2,25 @@
 # Copyright: (c) 2018, t5w5h5@gmail.com. All rights reserved.
 # License: MIT, see LICENSE for details.
 
+import time
 import unittest
 
 from rdate import *
 
 
+_PERIODS = tuple(Period)
+
+_D_20150131 = Date(2015, 1, 31)
+_D_20150201 = Date(2015, 2, 1)
+_D_20150202 = Date(2015, 2, 2)
+_D_20150601 = Date(2015, 6, 1)
+_D_20150602 = Date(2015, 6, 2)
+_D_20150605 = Date(2015, 6, 5)
+_D_20150607 = Date(2015, 6, 7)
+_D_20150620 = Date(2015, 6, 20)
+_D_20150705 = Date(2015, 7, 5)
+
+
 class TestEnums(unittest.TestCase):
 
     def test_period(self):
@@ -14,9 +28,8 @@ class TestEnums(unittest.TestCase):
         self.assertTrue(Period.Week < Period.Month)
         self.assertFalse(Period.Week > Period.Month)
         self.assertFalse(Period.Week == Period.Month)
-        period = list(Period)
-        for p in range(len(period)-1):
-            self.assertTrue(period[p] < period[p+1])
+        for a, b in zip(_PERIODS, _PERIODS[1:]):
+            self.assertLess(a, b)
 
     def _test_weekday(self, first_day=None):
         if first_day is not None:
@@ -28,11 +41,13 @@ class TestEnums(unittest.TestCase):
         self.assertEqual(Weekday.Monday+1, Weekday.Tuesday)
         self.assertEqual(Weekday.Monday+7, Weekday.Monday)
         self.assertEqual(Weekday.Monday+8, Weekday.Tuesday)
+        self.assertEqual(Weekday.Sunday+1, Weekday.Monday)
 
         # Subtraction
         self.assertEqual(Weekday.Monday-1, Weekday.Sunday)
         self.assertEqual(Weekday.Monday-7, Weekday.Monday)
         self.assertEqual(Weekday.Monday-8, Weekday.Sunday)
+        self.assertEqual(Weekday.Sunday-1, Weekday.Saturday)
 
         # Difference
         self.assertEqual(Weekday.Sunday - Weekday.Sunday, 0)
@@ -45,8 +60,8 @@ class TestEnums(unittest.TestCase):
         self.assertFalse(Weekday.Monday > Weekday.Friday)
         self.assertFalse(Weekday.Monday == Weekday.Friday)
         wds = Weekday.range()
-        for d in range(len(wds)-1):
-            self.assertTrue(wds[d] < wds[d+1])
+        for a, b in zip(wds, wds[1:]):
+            self.assertLess(a, b)
 
     def test_weekday(self):
         self._test_weekday()
@@ -60,17 +75,21 @@ class TestTime(unittest.TestCase):
         self.assertEqual(t1, t2)
 
     def test_init(self):
-        with self.assertRaisesRegex(ValueError, "Invalid hour: 24"):
+        with self.assertRaises(ValueError) as cm:
             Time(24, 0, 0)
+        self.assertEqual(str(cm.exception), "Invalid hour: 24")
 
-        with self.assertRaisesRegex(ValueError, "Invalid time: 2.0"):
+        with self.assertRaises(ValueError) as cm:
             Time(2.0)
+        self.assertEqual(str(cm.exception), "Invalid time: 2.0")
 
-        with self.assertRaisesRegex(ValueError, "Invalid time: invalid"):
+        with self.assertRaises(ValueError) as cm:
             Time('invalid')
+        self.assertEqual(str(cm.exception), "Invalid time: invalid")
 
-        with self.assertRaisesRegex(ValueError, "Invalid time: 123:10:00"):
+        with self.assertRaises(ValueError) as cm:
             Time('123:10:00')
+        self.assertEqual(str(cm.exception), "Invalid time: 123:10:00")
 
         # from ints
         self.assertEqual(Time(12, 10, 1), Time(12, 10, 1))
@@ -79,6 +98,10 @@ class TestTime(unittest.TestCase):
         self.assertEqual(Time('12:10:00'), Time(12, 10))
         self.assertEqual(Time('12:1'), Time(12, 1))
         self.assertEqual(Time('1:19'), Time(1, 19))
+        self.assertEqual(Time('1:2:3'), Time(1, 2, 3))
+        self.assertEqual(Time('12:30:45.123'), Time(12, 30, 45))
+        self.assertEqual(Time('1:2:3:4'), Time(1, 2, 3))
+        self.assertEqual(Time('١:٢'), Time(1, 2))
 
         # from Time
         t = Time.now()
@@ -109,22 +132,35 @@ class TestTime(unittest.TestCase):
 
 class TestDate(unittest.TestCase):
 
+    def setUp(self):
+        self._today = Date.today()
+
     def test_today(self):
-        d = Date.today()
+        d = self._today
         self.assertEqual(d, d.next().prev())
 
+        class SubDate(Date):
+            __slots__ = ()
+
+        self.assertIs(type(SubDate.today()), SubDate)
+        self.assertIs(type(Date.today()), Date)
+
     def test_init(self):
-        with self.assertRaisesRegex(ValueError, "Invalid month: 13"):
+        with self.assertRaises(ValueError) as cm:
             Date(2015, 13, 1)
+        self.assertEqual(str(cm.exception), "Invalid month: 13")
 
-        with self.assertRaisesRegex(ValueError, "Invalid date: invalid"):
+        with self.assertRaises(ValueError) as cm:
             Date('invalid')
+        self.assertEqual(str(cm.exception), "Invalid date: invalid")
 
-        with self.assertRaisesRegex(ValueError, "Invalid date: 10-01-01"):
+        with self.assertRaises(ValueError) as cm:
             Date('10-01-01')
+        self.assertEqual(str(cm.exception), "Invalid date: 10-01-01")
 
-        with self.assertRaisesRegex(ValueError, "Invalid date: 1.0"):
+        with self.assertRaises(ValueError) as cm:
             Date(1.0)
+        self.assertEqual(str(cm.exception), "Invalid date: 1.0")
 
         # from ints
         self.assertEqual(Date(2014, 12, 31), Date(2014, 12, 31))
@@ -132,13 +168,16 @@ class TestDate(unittest.TestCase):
         # from str
         self.assertEqual(Date('2010-11-12'), Date(2010, 11, 12))
         self.assertEqual(Date('2010-1-1'), Date(2010, 1, 1))
+        self.assertEqual(Date('2010-11-12 10:00'), Date(2010, 11, 12))
+        self.assertEqual(Date('2010-1-2\n'), Date(2010, 1, 2))
+        self.assertEqual(Date('２０１５-01-01'), Date(2015, 1, 1))
 
         # from Date
-        d = Date.today()
+        d = self._today
         self.assertEqual(Date(d), d)
 
     def test_comparisons(self):
-        d = Date.today()
+        d = self._today
 
         self.assertEqual(d, d.next().prev())
         self.assertEqual(d, d.next(1, Period.Week).prev(1, Period.Week))
@@ -161,6 +200,8 @@ class TestDate(unittest.TestCase):
         self.assertEqual(d.next(), Date(2015, 1, 2))
         self.assertEqual(d.next(44), Date(2015, 2, 14))
         self.assertEqual(d.next(0), d)
+        self.assertEqual(d.next(1.5), Date(2015, 1, 2))
+        self.assertEqual(d.prev(1.5), Date(2014, 12, 30))
 
     def test_prev(self):
         d = Date(2015, 1, 1)
@@ -176,25 +217,25 @@ class TestDate(unittest.TestCase):
         self.assertEqual(Date(2014, 2, 28).prev(1, Period.Month), Date(2014, 1, 28))
 
     def test_envelope(self):
-        d = Date(2015, 6, 2)
+        d = _D_20150602
 
         ds, de = d.envelope(Period.Day)
         self.assertEqual(ds, d)
         self.assertEqual(de, ds)
 
-        ds, de = d.envelope(Period.Day, Date(2015, 6, 5))
+        ds, de = d.envelope(Period.Day, _D_20150605)
         self.assertEqual(ds, d)
-        self.assertEqual(de, Date(2015, 6, 5))
+        self.assertEqual(de, _D_20150605)
 
         with self.assertRaises(ValueError):
-            ds, de = d.envelope(Period.Day, Date(2015, 6, 1))
+            ds, de = d.envelope(Period.Day, _D_20150601)
 
         ws, we = d.envelope()
-        self.assertEqual(ws, Date(2015, 6, 1))
-        self.assertEqual(we, Date(2015, 6, 7))
+        self.assertEqual(ws, _D_20150601)
+        self.assertEqual(we, _D_20150607)
 
         ms, me = d.envelope(Period.Month)
-        self.assertEqual(ms, Date(2015, 6, 1))
+        self.assertEqual(ms, _D_20150601)
         self.assertEqual(me, Date(2015, 6, 30))
 
         ys, ye = d.envelope(Period.Year)
@@ -202,30 +243,30 @@ class TestDate(unittest.TestCase):
         self.assertEqual(ye, Date(2015, 12, 31))
 
         ws, we = d.envelope(to_date=Date(2015, 7, 2))
-        self.assertEqual(ws, Date(2015, 6, 1))
-        self.assertEqual(we, Date(2015, 7, 5))
+        self.assertEqual(ws, _D_20150601)
+        self.assertEqual(we, _D_20150705)
 
-        ws, we = Date(2015, 6, 1).envelope(to_date=Date(2015, 7, 5))
-        self.assertEqual(ws, Date(2015, 6, 1))
-        self.assertEqual(we, Date(2015, 7, 5))
+        ws, we = _D_20150601.envelope(to_date=_D_20150705)
+        self.assertEqual(ws, _D_20150601)
+        self.assertEqual(we, _D_20150705)
 
     def test_diff(self):
-        self.assertEqual(Date(2015, 6, 1).diff(Date(2015, 6, 1)), 0)
-        self.assertEqual(Date(2015, 6, 1).diff(Date(2015, 6, 2)), 1)
-        self.assertEqual(Date(2015, 6, 2).diff(Date(2015, 6, 1)), -1)
+        self.assertEqual(_D_20150601.diff(_D_20150601), 0)
+        self.assertEqual(_D_20150601.diff(_D_20150602), 1)
+        self.assertEqual(_D_20150602.diff(_D_20150601), -1)
 
-        self.assertEqual(Date(2015, 6, 2).diff(Date(2015, 6, 7), Period.Week), 0)
-        self.assertEqual(Date(2015, 6, 2).diff(Date(2015, 6, 8), Period.Week), 1)
-        self.assertEqual(Date(2015, 6, 2).diff(Date(2015, 5, 28), Period.Week), -1)
+        self.assertEqual(_D_20150602.diff(_D_20150607, Period.Week), 0)
+        self.assertEqual(_D_20150602.diff(Date(2015, 6, 8), Period.Week), 1)
+        self.assertEqual(_D_20150602.diff(Date(2015, 5, 28), Period.Week), -1)
 
-        self.assertEqual(Date(2015, 6, 20).diff(Date(2015, 6, 7), Period.Month), 0)
-        self.assertEqual(Date(2015, 6, 20).diff(Date(2015, 7, 1), Period.Month), 1)
-        self.assertEqual(Date(2015, 6, 20).diff(Date(2015, 5, 1), Period.Month), -1)
+        self.assertEqual(_D_20150620.diff(_D_20150607, Period.Month), 0)
+        self.assertEqual(_D_20150620.diff(Date(2015, 7, 1), Period.Month), 1)
+        self.assertEqual(_D_20150620.diff(Date(2015, 5, 1), Period.Month), -1)
         self.assertEqual(Date(2015, 6).diff(Date(2014, 5), Period.Month), -13)
 
         self.assertEqual(Date(2015, 1, 1).diff(Date(2015, 12, 31), Period.Year), 0)
-        self.assertEqual(Date(2015, 6, 20).diff(Date(2016, 7, 1), Period.Year), 1)
-        self.assertEqual(Date(2015, 6, 20).diff(Date(2014, 5, 1), Period.Year), -1)
+        self.assertEqual(_D_20150620.diff(Date(2016, 7, 1), Period.Year), 1)
+        self.assertEqual(_D_20150620.diff(Date(2014, 5, 1), Period.Year), -1)
         self.assertEqual(Date(2010).diff(Date(2014), Period.Year), 4)
 
     def test_length(self):
@@ -233,44 +274,80 @@ class TestDate(unittest.TestCase):
         self.assertEqual(Date(2012, 2, 6).length(), 29)
         self.assertEqual(Date(2013, 2, 6).length(period=Period.Year), 365)
         self.assertEqual(Date(2012, 2, 6).length(period=Period.Year), 366)
+        self.assertEqual(Date(2012, 2, 6).length(period=Period.Week), 7)
+        self.assertEqual(Date(2012, 2, 6).length(period=Period.Day), 1)
 
     def test_range(self):
-        self.assertEqual(Date(2015, 2, 1).range(n=0)[0], Date(2015, 2, 1))
-        self.assertEqual(Date(2015, 2, 1).range(Date(2015, 2, 1))[0], Date(2015, 2, 1))
-
-        self.assertEqual(len(Date(2015, 2, 1).range(n=0)), 1)
-        self.assertEqual(len(Date(2015, 2, 1).range(n=1)), 2)
-        self.assertEqual(len(Date(2015, 2, 1).range(n=-1)), 2)
-        self.assertEqual(Date(2015, 2, 1).range(n=1)[1], Date(2015, 2, 2))
-        self.assertEqual(Date(2015, 2, 1).range(n=-1)[1], Date(2015, 1, 31))
-
-        self.assertEqual(len(Date(2015, 2, 1).range(Date(2015, 2, 1))), 1)
-        self.assertEqual(len(Date(2015, 2, 1).range(Date(2015, 2, 2))), 2)
-        self.assertEqual(len(Date(2015, 2, 1).range(Date(2015, 1, 31))), 2)
-        self.assertEqual(Date(2015, 2, 1).range(Date(2015, 2, 2))[1], Date(2015, 2, 2))
-        self.assertEqual(Date(2015, 2, 1).range(Date(2015, 1, 31))[1], Date(2015, 1, 31))
+        self.assertEqual(_D_20150201.range(n=0)[0], _D_20150201)
+        self.assertEqual(_D_20150201.range(_D_20150201)[0], _D_20150201)
+
+        self.assertEqual(len(_D_20150201.range(n=0)), 1)
+        self.assertEqual(len(_D_20150201.range(n=1)), 2)
+        self.assertEqual(len(_D_20150201.range(n=-1)), 2)
+        self.assertEqual(_D_20150201.range(n=1)[1], _D_20150202)
+        self.assertEqual(_D_20150201.range(n=-1)[1], _D_20150131)
+
+        self.assertEqual(len(_D_20150201.range(_D_20150201)), 1)
+        self.assertEqual(len(_D_20150201.range(_D_20150202)), 2)
+        self.assertEqual(len(_D_20150201.range(_D_20150131)), 2)
+        self.assertEqual(_D_20150201.range(_D_20150202)[1], _D_20150202)
+        self.assertEqual(_D_20150201.range(_D_20150131)[1], _D_20150131)
+
+    def test_date_range(self):
+        r = _D_20150201.range(n=-2)
+        self.assertIsInstance(r, DateRange)
+        self.assertEqual(list(r), [_D_20150201, _D_20150131, Date(2015, 1, 30)])
+        self.assertEqual(list(reversed(r)), [Date(2015, 1, 30), _D_20150131, _D_20150201])
+        self.assertEqual(r[-1], Date(2015, 1, 30))
+        self.assertEqual(list(r[1:]), [_D_20150131, Date(2015, 1, 30)])
+        self.assertIn(_D_20150131, r)
+        self.assertNotIn(_D_20150202, r)
+        self.assertEqual(r, Date(2015, 1, 30).range(n=2)[::-1])
+        self.assertEqual(_D_20150201.range(n=1), [_D_20150201, _D_20150202])
+        self.assertEqual([_D_20150201, _D_20150202], _D_20150201.range(n=1))
+        self.assertNotEqual(_D_20150201.range(n=1), [_D_20150201])
+
+        with self.assertRaises(IndexError):
+            r[3]
+
+    def test_range_ordinals(self):
+        ordinals = Date.range_ordinals(Date(2015, 2, 1), Date(2015, 2, 3))
+        self.assertEqual(len(ordinals), 3)
+        self.assertEqual(ordinals[0], 735630)
+        self.assertEqual(Date.from_ordinal(ordinals[2]), Date(2015, 2, 3))
+        self.assertEqual([Date.from_ordinal(o) for o in Date.range_ordinals(Date(2015, 2, 1), Date(2015, 1, 30))],
+                         [Date(2015, 2, 1), Date(2015, 1, 31), Date(2015, 1, 30)])
+
+    def test_from_ordinal(self):
+        self.assertEqual(Date.from_ordinal(735630), Date(2015, 2, 1))
+        with self.assertRaises(ValueError):
+            Date.from_ordinal(1)
 
     def test_attr(self):
-        d = Date(2015, 6, 2)
+        d = _D_20150602
         self.assertEqual(d.year, 2015)
         self.assertEqual(d.month, 6)
         self.assertEqual(d.day, 2)
         self.assertEqual(d.weekday, Weekday.Tuesday)
 
     def test_istoday(self):
-        self.assertTrue(Date.today().istoday)
-        self.assertFalse(Date.today().next().istoday)
+        today = self._today
+        tomorrow = today.next()
+        self.assertTrue(today.istoday)
+        self.assertFalse(tomorrow.istoday)
         self.assertFalse(Date(2014, 1, 1).istoday)
 
     def test_isweekend(self):
-        self.assertFalse(Date(2015, 6, 5).isweekend)
+        self.assertFalse(_D_20150605.isweekend)
         self.assertTrue(Date(2015, 6, 6).isweekend)
-        self.assertTrue(Date(2015, 6, 7).isweekend)
+        self.assertTrue(_D_20150607.isweekend)
         self.assertFalse(Date(2015, 6, 8).isweekend)
 
     def test_isleap(self):
         self.assertFalse(Date(2013, 2, 6).isleap)
         self.assertTrue(Date(2012, 2, 6).isleap)
+        self.assertTrue(Date(2000, 2, 6).isleap)
+        self.assertFalse(Date(1900, 2, 6).isleap)
 
     def test_equal(self):
         d1 = Date('2015-05-17')
@@ -278,6 +355,14 @@ class TestDate(unittest.TestCase):
         self.assertEqual(d1, d2)
         self.assertFalse(d1 == None)
 
+    def test_str(self):
+        self.assertEqual(str(Date(2015, 3, 5)), '2015-03-05')
+        self.assertEqual(str(Date(1999, 12, 31)), '1999-12-31')
+
+    def test_hash(self):
+        self.assertEqual(hash(Date(2015, 5, 17)), hash(Date('2015-05-17')))
+        self.assertEqual(len({Date(2015, 5, 17), Date(2015, 5, 17), Date(2015, 5, 18)}), 2)
+
     def test_find_day(self):
         with self.assertRaises(ValueError):
             Date.find_day(2015, 2, Weekday.Sunday, 10)
@@ -285,6 +370,9 @@ class TestDate(unittest.TestCase):
         with self.assertRaises(ValueError):
             Date.find_day(2015, 2, Weekday.Sunday, 5)
 
+        with self.assertRaises(ValueError):
+            Date.find_day(2015, 3, Weekday.Sunday, 0)
+
         self.assertEqual(Date.find_day(2015, 3, Weekday.Sunday, 1), Date(2015, 3, 1))
         self.assertEqual(Date.find_day(2015, 3, Weekday.Sunday, 2), Date(2015, 3, 8))
         self.assertEqual(Date.find_day(2015, 3, Weekday.Tuesday, 5), Date(2015, 3, 31))
@@ -292,20 +380,28 @@ class TestDate(unittest.TestCase):
 
 class TestDateTime(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls._DT_base = DateTime('2015-05-17 15:33:26')
+        cls._DT_next = DateTime('2015-05-17 15:33:27')
+
     def test_now(self):
         dt = DateTime.now()
         self.assertEqual(dt.date, Date.today())
         self.assertEqual(dt.time, Time.now())
 
     def test_create(self):
-        with self.assertRaisesRegex(ValueError, "Invalid date/time: 1.0"):
+        with self.assertRaises(ValueError) as cm:
             DateTime(1.0)
+        self.assertEqual(str(cm.exception), "Invalid date/time: 1.0")
 
-        with self.assertRaisesRegex(ValueError, "Invalid date/time: 2015-05-17-15:33:26"):
+        with self.assertRaises(ValueError) as cm:
             DateTime('2015-05-17-15:33:26')
+        self.assertEqual(str(cm.exception), "Invalid date/time: 2015-05-17-15:33:26")
 
-        with self.assertRaisesRegex(ValueError, "Invalid date/time: 15-05-17 15:33:26"):
+        with self.assertRaises(ValueError) as cm:
             DateTime('15-05-17 15:33:26')
+        self.assertEqual(str(cm.exception), "Invalid date/time: 15-05-17 15:33:26")
 
         # from str
         dt = DateTime('2015-3-11 0:0')
@@ -316,6 +412,13 @@ class TestDateTime(unittest.TestCase):
         self.assertEqual(dt.date, Date(2015, 5, 17))
         self.assertEqual(dt.time, Time(15, 33, 26))
 
+        dt = DateTime('2015-05-17T15:33')
+        self.assertEqual(dt.date, Date(2015, 5, 17))
+        self.assertEqual(dt.time, Time(15, 33))
+
+        dt = DateTime((Date(2015, 5, 17), Time(15, 33, 26)))
+        self.assertEqual(DateTime(str(dt)), dt)
+
         # from DateTime
         dt = DateTime('2015-05-17,15:33:26')
         self.assertEqual(DateTime(dt), dt)
@@ -332,18 +435,19 @@ class TestDateTime(unittest.TestCase):
         self.assertEqual(DateTime.now().since(), 0)
 
     def test_to(self):
-        self.assertEqual(DateTime('2015-05-17 15:33:26').to(36001), DateTime('2015-05-18 1:33:27'))
-        self.assertEqual(DateTime('2015-05-17 15:33:26').to(-36001), DateTime('2015-05-17 5:33:25'))
+        self.assertEqual(self._DT_base.to(36001), DateTime('2015-05-18 1:33:27'))
+        self.assertEqual(self._DT_base.to(-36001), DateTime('2015-05-17 5:33:25'))
+        self.assertEqual(self._DT_base.to(1), self._DT_next)
 
     def test_equal(self):
-        dt1 = DateTime('2015-05-17 15:33:26')
-        dt2 = DateTime('2015-05-17 15:33:26')
+        dt1 = DateTime(self._DT_base)
+        dt2 = DateTime(self._DT_base)
         self.assertEqual(dt1, dt2)
         self.assertFalse(dt1 is None)
 
     def test_comparisons(self):
-        dt1 = DateTime('2015-05-17 15:33:26')
-        dt2 = DateTime('2015-05-17 15:33:27')
+        dt1 = self._DT_base
+        dt2 = self._DT_next
         self.assertNotEqual(dt1, dt2)
         self.assertTrue(dt1 < dt2)
         self.assertTrue(dt1 <= dt2)
@@ -370,5 +474,9 @@ class TestTimestamp(unittest.TestCase):
         self.assertEqual(t2, t1)
 
         t1 = timestamp(prec=0.000001)
+        time.sleep(0.000002)
         t2 = timestamp(prec=0.000001)
         self.assertGreater(t2, t1)
+
+        self.assertAlmostEqual(timestamp(prec=2.5e-9) * 2.5e-9, time.time(), delta=1)
+        self.assertAlmostEqual(timestamp(prec=1/3) / 3, time.time(), delta=1)